@@ -1,10 +1,12 @@
 import random
-import queue
-from typing import List
+from typing import Dict, List, Optional, Set, Tuple
 from enum import IntEnum, auto
 import math
+from itertools import compress
+from array import array
 
 from .raylib import *
+from .raylib.keys import KeyboardKey
 
 
 FIELD_COLOR_FIRST  = Color(0x3B, 0x83, 0x1D, 0xFF)
@@ -20,6 +22,17 @@ ROWS = 10
 FIELD_SIZE = CELL_SIZE * Vector2(COLS, ROWS)
 FIELD_FRAME_SIZE = Vector2(30, 30)
 
+# Screen position of every cell, indexed as CELL_POS[y][x]
+CELL_POS = [
+    [Vector2(x * CELL_SIZE.x, y * CELL_SIZE.y) for x in range(COLS)]
+    for y in range(ROWS)
+]
+
+# Screen position of every cell center, indexed as CELL_CENTER[y][x]
+CELL_CENTER = [
+    [Vector2(pos.x + CELL_SIZE.x / 2, pos.y + CELL_SIZE.y / 2) for pos in row]
+    for row in CELL_POS
+]
 
 
 class Direction(IntEnum):
@@ -29,228 +42,338 @@ class Direction(IntEnum):
     UP    = auto()
 
 
+# Cells are plain (x, y) tuples, Vector2 is only built for raylib calls
+Cell = Tuple[int, int]
+
+
 directions = {
-    Direction.LEFT:  Vector2(-1, 0),
-    Direction.RIGHT: Vector2(1, 0),
-    Direction.DOWN:  Vector2(0, 1),
-    Direction.UP:    Vector2(0, -1)
+    Direction.LEFT:  (-1, 0),
+    Direction.RIGHT: (1, 0),
+    Direction.DOWN:  (0, 1),
+    Direction.UP:    (0, -1)
+}
+
+
+# Direction between two neighbour cells by their coordinate difference,
+# including the steps that wrap around the field edges
+cells_delta_dir = {
+    (-1, 0):          Direction.LEFT,
+    (1, 0):           Direction.RIGHT,
+    (0, 1):           Direction.DOWN,
+    (0, -1):          Direction.UP,
+    (COLS - 1, 0):    Direction.LEFT,
+    (-(COLS - 1), 0): Direction.RIGHT,
+    (0, ROWS - 1):    Direction.UP,
+    (0, -(ROWS - 1)): Direction.DOWN
+}
+
+
+def cell_step(a: Cell, b: Cell) -> Cell:
+    # Steps are a single cell, so crossing an edge wraps by exactly one
+    # field width or height and no modulo is needed
+    x = a[0] + b[0]
+    if x >= COLS:
+        x -= COLS
+    elif x < 0:
+        x += COLS
+
+    y = a[1] + b[1]
+    if y >= ROWS:
+        y -= ROWS
+    elif y < 0:
+        y += ROWS
+
+    return (x, y)
+
+
+def cells_dir(a: Cell, b: Cell) -> Direction:
+    return cells_delta_dir[(b[0] - a[0], b[1] - a[1])]
+
+
+def opposite_dir(direction: Direction) -> Direction:
+    return (direction + 2) % len(directions)
+
+
+# Middle of every cell's edge in each direction, indexed as
+# CELL_EDGE[direction][y][x], used as the ends of the snake body lines
+CELL_EDGE = {
+    direction: [
+        [
+            Vector2(pos.x + CELL_SIZE.x * (1 + dx) / 2,
+                    pos.y + CELL_SIZE.y * (1 + dy) / 2)
+            for pos in row
+        ]
+        for row in CELL_POS
+    ]
+    for direction, (dx, dy) in directions.items()
 }
 
 
 class Snake:
 
     def __init__(self):
-        self.cells: List[Vector2] = []
+        # Cell coordinates are stored column-wise, cell n is (xs[n], ys[n])
+        self.xs = array('h')
+        self.ys = array('h')
+        # Same cells as a set, for constant time lookups
+        self.occupied: Set[Cell] = set()
         self.dir: Direction = Direction.RIGHT
         self.hue = 40
         self.line_hue = 10
+        self.update_colors(0)
 
     @property
-    def head(self) -> Vector2:
-        return self.cells[-1]
+    def head(self) -> Cell:
+        return (self.xs[-1], self.ys[-1])
 
     @head.setter
-    def head(self, head: Vector2) -> None:
-        self.cells[-1] = head
+    def head(self, head: Cell) -> None:
+        self.occupied.discard(self.head)
+        self.occupied.add(head)
+        self.xs[-1], self.ys[-1] = head
 
     @property
-    def tail(self) -> Vector2:
-        return self.cells[0]
+    def tail(self) -> Cell:
+        return (self.xs[0], self.ys[0])
 
     @tail.setter
-    def tail(self, tail: Vector2) -> None:
-        self.cells[0] = tail
-
-    def pop(self, index: int = -1):
-        return self.cells.pop(index)
+    def tail(self, tail: Cell) -> None:
+        self.occupied.discard(self.tail)
+        self.occupied.add(tail)
+        self.xs[0], self.ys[0] = tail
+
+    def pop(self, index: int = -1) -> Cell:
+        cell = (self.xs.pop(index), self.ys.pop(index))
+        self.occupied.discard(cell)
+        return cell
 
-    def append(self, cell: Vector2):
-        self.cells.append(cell)
+    def append(self, cell: Cell):
+        self.xs.append(cell[0])
+        self.ys.append(cell[1])
+        self.occupied.add(cell)
 
     def __len__(self) -> int:
-        return len(self.cells)
+        return len(self.xs)
 
-    def __getitem__(self, index: int) -> Vector2:
-        return self.cells[index]
+    def __getitem__(self, index: int) -> Cell:
+        return (self.xs[index], self.ys[index])
 
     def __iter__(self):
-        for cell in self.cells:
-            yield cell
+        return zip(self.xs, self.ys)
 
-    def is_body(self, cell: Vector2) -> bool:
-        for body_cell in self:
-            if body_cell == cell:
-                return True
-        return False
+    def is_body(self, cell: Cell) -> bool:
+        return cell in self.occupied
 
     def update_colors(self, dt: float) -> None:
+        # Colors are converted once per update here and then only read
+        # while rendering every segment
         self.hue = (self.hue + dt * 10) % 360
         self.line_hue = (self.line_hue + dt * 10) % 360
+        self.color: Color = color_from_hsv(self.hue, 0.60, 0.75)
+        self.line_color: Color = color_from_hsv(self.line_hue, 0.60, 0.50)
+
+
+class Particles:
+
+    # Every particle attribute is kept in its own list (indexed by particle)
+    # so a frame update is a few list comprehensions instead of a method
+    # call per particle
+    def __init__(self) -> None:
+        self.pos_x: List[float] = []
+        self.pos_y: List[float] = []
+        self.vel_x: List[float] = []
+        self.vel_y: List[float] = []
+        self.radius: List[float] = []
+        self.lifetime: List[float] = []
+        self.max_lifetime: List[float] = []
+        # Each particle refers to a table of its color faded to every alpha
+        # from 0 to 255, shared by all particles of the same color
+        self.fade: List[List[Color]] = []
+        self.fade_tables: Dict[bytes, List[Color]] = {}
 
-    @property
-    def color(self) -> Color:
-        return color_from_hsv(self.hue, 0.60, 0.75)
-
-    @property
-    def line_color(self) -> Color:
-        #return self.color
-        return color_from_hsv(self.line_hue, 0.60, 0.50)
-
-
-class Particle:
-
-    def __init__(self, pos: Vector2, color: Color) -> None:
-        self.pos = pos
-        self.velocity: Vector2 = Vector2(random.randint(-400, 400),
-                                         random.randint(-400, 400))
-        self.radius: float = 10 + random.random() * 15
-        self.max_lifetime = random.random()
-        self.lifetime = self.max_lifetime
-        self.initial_color = color
-
-    def __bool__(self) -> bool:
-        return self.lifetime > 0.0
-
-    @property
-    def color(self) -> Color:
-        alpha = self.max_lifetime / self.lifetime
-        return color_alpha(self.initial_color, alpha)
+    def __len__(self) -> int:
+        return len(self.lifetime)
+
+    def spawn(self, pos: Tuple[float, float], color: Color) -> None:
+        self.pos_x.append(pos[0])
+        self.pos_y.append(pos[1])
+        self.vel_x.append(random.randint(-400, 400))
+        self.vel_y.append(random.randint(-400, 400))
+        self.radius.append(10 + random.random() * 15)
+        max_lifetime = random.random()
+        self.max_lifetime.append(max_lifetime)
+        self.lifetime.append(max_lifetime)
+        self.fade.append(self.fade_table(color))
+
+    def fade_table(self, color: Color) -> List[Color]:
+        key = bytes(color)
+        table = self.fade_tables.get(key)
+        if table is None:
+            r, g, b = color.r, color.g, color.b
+            table = [Color(r, g, b, alpha) for alpha in range(256)]
+            self.fade_tables[key] = table
+        return table
 
     def update(self, dt: float) -> None:
-        if self:
-            self.lifetime -= dt
-            self.pos += self.velocity * dt
+        self.lifetime = [lifetime - dt for lifetime in self.lifetime]
+        self.pos_x = [x + vx * dt for x, vx in zip(self.pos_x, self.vel_x)]
+        self.pos_y = [y + vy * dt for y, vy in zip(self.pos_y, self.vel_y)]
+
+        alive = [lifetime > 0.0 for lifetime in self.lifetime]
+        self.pos_x = list(compress(self.pos_x, alive))
+        self.pos_y = list(compress(self.pos_y, alive))
+        self.vel_x = list(compress(self.vel_x, alive))
+        self.vel_y = list(compress(self.vel_y, alive))
+        self.radius = list(compress(self.radius, alive))
+        self.lifetime = list(compress(self.lifetime, alive))
+        self.max_lifetime = list(compress(self.max_lifetime, alive))
+        self.fade = list(compress(self.fade, alive))
+
+    def colors(self) -> List[Color]:
+        # Only alive particles are left after update(), so lifetime is
+        # always in (0, max_lifetime] here and particles fade out over time
+        return [
+            fade[int(lifetime / max_lifetime * 255)]
+            for fade, lifetime, max_lifetime
+            in zip(self.fade, self.lifetime, self.max_lifetime)
+        ]
 
 
 class Game:
 
     STEP_INTERVAL = 0.125
+    # Longest frame time fed to the step loop, see update_game
+    MAX_FRAME_TIME = 0.25
 
     def __init__(self):
        self.reset_game()
 
     def reset_game(self):
-        self.next_dirs = queue.Queue()
+        # Last direction pressed since the previous step
+        self.next_dir: Optional[Direction] = None
 
         self.snake = Snake()
-        self.snake.append(Vector2(0, 0))
-        self.snake.append(Vector2(1, 0))
-        self.snake.append(Vector2(2, 0))
+        self.snake.append((0, 0))
+        self.snake.append((1, 0))
+        self.snake.append((2, 0))
 
         self.game_over = False
         self.pause = False
-        self.step_cooldown = 0
+        # Time since the last step, starts full so the first frame steps
+        self.step_time = self.STEP_INTERVAL
         self.score = 0
 
         self.apple = None
         self.new_apple()
 
-        self.particles: List[Particle] = []
-
-    def random_cell(self):
-        cell = Vector2()
-        cell.x = random.randint(0, COLS - 1)
-        cell.y = random.randint(0, ROWS - 1)
-        return cell
-
-    def cell_step(self, a: Vector2, b: Vector2) -> Vector2:
-        c: Vector2 = a + b
-        c.x %= COLS
-        c.y %= ROWS
-        return c
-
-    def cells_dir(self, a: Vector2, b: Vector2) -> Vector2:
-        for direction, vector in directions.items():
-            if self.cell_step(a, vector) == b:
-                return direction
-
-    def opposite_dir(self, direction: Direction) -> Direction:
-        return (direction + 2) % len(directions)
+        self.particles = Particles()
 
     def new_apple(self):
-        if len(self.snake) == ROWS*COLS:
-            return None
-
-        new_apple = None
-        while True:
-            new_apple = self.random_cell()
-            if not self.snake.is_body(new_apple):
-                break
-        self.apple = new_apple
+        free_cells = [
+            (x, y)
+            for y in range(ROWS)
+            for x in range(COLS)
+            if (x, y) not in self.snake.occupied
+        ]
+        self.apple = random.choice(free_cells) if free_cells else None
 
     def generate_particles(self):
         for cell in self.snake:
             for _ in range(10):
-                pos = cell * CELL_SIZE
-                self.particles.append(Particle(pos, self.snake.color))
-
+                pos = (cell[0] * CELL_SIZE.x, cell[1] * CELL_SIZE.y)
+                self.particles.spawn(pos, self.snake.color)
 
-def render_field(texture: RenderTexture) -> None:
-    begin_texture_mode(texture)
-    for y in range(ROWS):
-        for x in range(COLS):
-            pos = Vector2(x, y) * CELL_SIZE
-            index = (x + y) % 2 == 0
-            color = FIELD_COLOR_FIRST if index else FIELD_COLOR_SECOND
-            draw_rectangle_v(pos, CELL_SIZE, color)
-    end_texture_mode()
 
+def render_snake(game: Game) -> None:
+    t = 1 - game.step_time / game.STEP_INTERVAL
+    color = game.snake.color
+    line_color = game.snake.line_color
 
-def render_snake(texture: RenderTexture, game: Game) -> None:
-    begin_texture_mode(texture)
-
-    t = game.step_cooldown / game.STEP_INTERVAL
+    xs, ys = game.snake.xs, game.snake.ys
+    # Direction from every cell to the next one, toward the head
+    links = [
+        cells_delta_dir[(x1 - x0, y1 - y0)]
+        for x0, y0, x1, y1 in zip(xs, ys, xs[1:], ys[1:])
+    ]
 
     tail = game.snake.tail
-    prev_cell = game.snake.cells[1] if len(game.snake) > 1 else None
-    tail_dir = game.cells_dir(tail, prev_cell) if prev_cell else game.snake.dir
-    tail_len = (CELL_SIZE * directions[tail_dir]) * (1 - t)
-    tail_size = CELL_SIZE - Vector2(math.fabs(tail_len.x), math.fabs(tail_len.y))
-    pos = tail * CELL_SIZE
+    tail_dir = links[0] if links else game.snake.dir
+    dx, dy = directions[tail_dir]
+    tail_len_x = CELL_SIZE.x * dx * (1 - t)
+    tail_len_y = CELL_SIZE.y * dy * (1 - t)
+    tail_size = Vector2(CELL_SIZE.x - math.fabs(tail_len_x),
+                        CELL_SIZE.y - math.fabs(tail_len_y))
+    pos = CELL_POS[tail[1]][tail[0]]
     if (tail_dir == Direction.RIGHT or tail_dir == Direction.DOWN):
-        pos += tail_len
-
-    draw_rectangle_v(pos, tail_size, game.snake.color)
+        pos = Vector2(pos.x + tail_len_x, pos.y + tail_len_y)
 
-    for index in range(1, len(game.snake) - 1):
-        prev_cell = game.snake[index - 1] if index > 0 else None
-        cell = game.snake[index]
-        next_cell = game.snake[index + 1]
+    draw_rectangle_v(pos, tail_size, color)
 
-        pos = cell * CELL_SIZE
-        draw_rectangle_v(pos, CELL_SIZE, game.snake.color)
+    # Look every body draw position up first, so the draw loops below only
+    # pass ready Vector2 values to raylib. Body lines never leave their own
+    # cell, so drawing all cells before all lines looks the same.
+    body = range(1, len(xs) - 1)
+    positions = [CELL_POS[ys[i]][xs[i]] for i in body]
+    centers = [CELL_CENTER[ys[i]][xs[i]] for i in body]
+    starts = [CELL_EDGE[opposite_dir(links[i - 1])][ys[i]][xs[i]] for i in body]
+    ends = [CELL_EDGE[links[i]][ys[i]][xs[i]] for i in body]
 
-        pos = cell*CELL_SIZE + CELL_SIZE/2
+    for pos in positions:
+        draw_rectangle_v(pos, CELL_SIZE, color)
 
-        size = Vector2(20, 20)
-
-        dir1 = directions[game.cells_dir(prev_cell, cell)]
-        start_pos = pos - (CELL_SIZE/2 * dir1)
-        draw_line_ex(start_pos, pos, 25, game.snake.line_color)
-
-        dir2 = game.cells_dir(cell, next_cell)
-        draw_line_ex(pos, pos+(CELL_SIZE/2 * directions[dir2]), 25, game.snake.line_color)
+    for start_pos, center, end_pos in zip(starts, centers, ends):
+        draw_line_ex(start_pos, center, 25, line_color)
+        draw_line_ex(center, end_pos, 25, line_color)
 
     # draw boa head
     head = game.snake.head
-    prev_cell = game.snake.cells[-2] if len(game.snake) > 1 else None
-    head_dir = game.cells_dir(head, prev_cell) if prev_cell else game.opposite_dir(game.snake.dir)
-    head_len = (CELL_SIZE * directions[head_dir]) * (t)
-    head_size = CELL_SIZE - Vector2(math.fabs(head_len.x), math.fabs(head_len.y))
-    pos = head * CELL_SIZE
+    head_dir = opposite_dir(links[-1]) if links else opposite_dir(game.snake.dir)
+    dx, dy = directions[head_dir]
+    head_len_x = CELL_SIZE.x * dx * t
+    head_len_y = CELL_SIZE.y * dy * t
+    head_size = Vector2(CELL_SIZE.x - math.fabs(head_len_x),
+                        CELL_SIZE.y - math.fabs(head_len_y))
+    pos = CELL_POS[head[1]][head[0]]
     if (head_dir == Direction.RIGHT or head_dir == Direction.DOWN):
-        pos += head_len
-
-    draw_rectangle_v(pos, head_size, game.snake.color)
+        pos = Vector2(pos.x + head_len_x, pos.y + head_len_y)
 
-    end_texture_mode
+    draw_rectangle_v(pos, head_size, color)
 
 
 def render_particles(game: Game, dt: float) -> None:
-    for particle in game.particles:
-        particle.update(dt)
-        if particle:
-            draw_circle_v(particle.pos, particle.radius, particle.color)
+    particles = game.particles
+    particles.update(dt)
+    for x, y, radius, color in zip(particles.pos_x,
+                                   particles.pos_y,
+                                   particles.radius,
+                                   particles.colors()):
+        draw_circle_v(Vector2(x, y), radius, color)
+
+
+def step_game(game: Game) -> None:
+    if game.next_dir is not None:
+        if game.snake.dir != opposite_dir(game.next_dir):
+            game.snake.dir = game.next_dir
+        game.next_dir = None
+
+    snake_step = directions[game.snake.dir]
+    new_head = cell_step(game.snake.head, snake_step)
+
+    # Collision is checked before growing, growing into the body would put
+    # the same cell in the snake twice
+    if game.snake.is_body(new_head):
+        game.generate_particles()
+        game.game_over = True
+    elif game.snake.head == game.apple:
+        game.snake.append(new_head)
+        game.new_apple()
+        game.score += 1
+    else:
+        game.snake.append(new_head)
+        game.snake.pop(0)
+
+    # occupied relies on every snake cell being unique
+    assert set(game.snake) == game.snake.occupied
 
 
 def update_game(game: Game, dt: int) -> None:
@@ -268,37 +391,23 @@ def update_game(game: Game, dt: int) -> None:
     if not game.game_over:
 
         if is_key_pressed(KeyboardKey.W):
-            game.next_dirs.put(Direction.UP)
+            game.next_dir = Direction.UP
         elif is_key_pressed(KeyboardKey.D):
-            game.next_dirs.put(Direction.RIGHT)
+            game.next_dir = Direction.RIGHT
         elif is_key_pressed(KeyboardKey.S):
-            game.next_dirs.put(Direction.DOWN)
+            game.next_dir = Direction.DOWN
         elif is_key_pressed(KeyboardKey.A):
-            game.next_dirs.put(Direction.LEFT)
+            game.next_dir = Direction.LEFT
 
-        game.step_cooldown -= dt
-
-        if game.step_cooldown <= 0.0:
-            game.step_cooldown = game.STEP_INTERVAL
-
-            if not game.next_dirs.empty():
-                next_dir = game.next_dirs.get(block=False)
-                if game.snake.dir != game.opposite_dir(next_dir):
-                    game.snake.dir = next_dir
-
-            snake_step = directions[game.snake.dir]
-            new_head = game.cell_step(game.snake.head, snake_step)
-
-            if game.snake.head == game.apple:
-                game.snake.append(new_head)
-                game.new_apple()
-                game.score += 1
-            elif game.snake.is_body(new_head):
-                game.generate_particles()
-                game.game_over = True
-            else:
-                game.snake.append(new_head)
-                game.snake.pop(0)
+        # The snake moves at a fixed rate no matter how long frames take,
+        # a slow frame just runs several steps at once. That only holds for
+        # normal hitches: frame time is clamped, so after a long stall (window
+        # drag, debugger break, wake from sleep) the game goes on from where it
+        # was instead of running a burst of steps before the next draw
+        game.step_time += min(dt, game.MAX_FRAME_TIME)
+        while game.step_time >= game.STEP_INTERVAL and not game.game_over:
+            game.step_time -= game.STEP_INTERVAL
+            step_game(game)
 
 
 def main() -> int:
@@ -307,72 +416,76 @@ def main() -> int:
     set_target_fps(60)
     init_window(FIELD_SIZE.x, FIELD_SIZE.y, 'Boa')
 
-    game_over = False
-
-    screen: RenderTexture = load_render_texture(
+    # The field never changes, so generate it once and reuse the texture
+    field_image: Image = gen_image_checked(
             COLS*CELL_SIZE.x,
-            ROWS*CELL_SIZE.y
+            ROWS*CELL_SIZE.y,
+            CELL_SIZE.x,
+            CELL_SIZE.y,
+            FIELD_COLOR_FIRST,
+            FIELD_COLOR_SECOND
     )
-    set_texture_filter(screen.texture, TextureFilter.BILINEAR)
+    field: Texture2D = load_texture_from_image(field_image)
+    unload_image(field_image)
+
+    # The window can't be resized, so the field always stays at the same
+    # place on the screen and everything is drawn relative to it
+    screen_size = Vector2(get_screen_width(), get_screen_height())
+    field_pos = (screen_size * 0.5) - (FIELD_SIZE * 0.5)
+    camera = Camera2D(field_pos, Vector2(0, 0), 0, 1)
+
+    frame_pos = FIELD_FRAME_SIZE * -0.5
+    frame_size = FIELD_SIZE + FIELD_FRAME_SIZE
+
+    game_over_text = b"Game Over"
+    game_over_font_size = 50
+    game_over_width = measure_text(game_over_text, game_over_font_size)
+
+    # Score text is only encoded again when the score changes
+    score = None
+    score_text = b''
+    score_font_size = 40
 
     game = Game()
 
     while not window_should_close():
         begin_drawing()
 
-        screen_size = Vector2(get_screen_width(), get_screen_height())
-
         clear_background(BACKGROUND_COLOR)
         dt = get_frame_time()
 
-        render_field(screen)
-        begin_texture_mode(screen)
+        begin_mode_2d(camera)
+
+        draw_rectangle_v(frame_pos, frame_size, FIELD_FRAME_COLOR)
+
+        draw_texture(field, 0, 0, WHITE)
 
         # draw apple
         if game.apple is not None:
-            pos = game.apple * CELL_SIZE
+            pos = CELL_POS[game.apple[1]][game.apple[0]]
             draw_rectangle_v(pos, CELL_SIZE, RED)
 
         if game.game_over:
             render_particles(game, dt)
-            font_size = 50
-            text_width = measure_text("Game Over", font_size)
-            draw_text("Game Over", screen_size.x/2 - text_width/2, screen_size.y/2 - font_size/2, font_size, RED)
+            draw_text(game_over_text,
+                      FIELD_SIZE.x/2 - game_over_width/2,
+                      FIELD_SIZE.y/2 - game_over_font_size/2,
+                      game_over_font_size,
+                      RED)
         else:
-            render_snake(screen, game)
-            font_size = 40
-            text_width = measure_text(f"Score: {game.score}", font_size)
-            draw_text(f"Score: {game.score}", 30, 30, font_size, BLACK)
-
-
-        end_texture_mode()
-
-        field_pos = (screen_size * 0.5) - (FIELD_SIZE * 0.5)
-
-        draw_rectangle_v(
-                field_pos - FIELD_FRAME_SIZE * 0.5,
-                FIELD_SIZE + FIELD_FRAME_SIZE,
-                FIELD_FRAME_COLOR
-        )
-        draw_texture_pro(
-                screen.texture,
-                Rectangle(0,
-                          0,
-                          screen.texture.width,
-                          -screen.texture.height),
-                Rectangle(field_pos.x,
-                          field_pos.y,
-                          screen.texture.width,
-                          screen.texture.height),
-                Vector2(0, 0),
-                0,
-                WHITE
-        )
+            render_snake(game)
+            if game.score != score:
+                score = game.score
+                score_text = f"Score: {score}".encode('UTF-8')
+            draw_text(score_text, 30, 30, score_font_size, BLACK)
+
+        end_mode_2d()
 
         update_game(game, dt)
 
         end_drawing()
 
+    unload_texture(field)
     close_window()
 
 
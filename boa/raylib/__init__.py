@@ -3,9 +3,10 @@ from __future__ import annotations
 import os
 import sys
 import ctypes
+import functools
 from ctypes import wintypes
-from enum import IntEnum, auto
-from typing import Union, List, Any, Tuple
+from enum import IntEnum
+from typing import Union, List, Any, Tuple, Sequence
 
 
 # ----------------------------
@@ -19,6 +20,7 @@ UInt = ctypes.c_uint
 Bool = ctypes.c_bool
 CharPtr = ctypes.c_char_p
 Char = ctypes.c_char
+UChar = ctypes.c_ubyte
 
 
 # ---------------
@@ -68,64 +70,82 @@ class Vector2(ctypes.Structure):
     def __bool__(self) -> bool:
         return self.x != 0 or self.y != 0
 
-    def __add__(self, other: Vector2) -> Vector2:
-        if isinstance(other, Vector2):
-            return vector2_add(self, other)
-        elif isinstance(other, int) or isinstance(other, float):
-            return vector2_add_value(self, other)
+    # Arithmetic is done in Python, going through raymath for two float
+    # operations would cost far more in ctypes overhead than the math itself
+
+    def __add__(self, other: Union[Vector2, float]) -> Vector2:
+        kind = type(other)
+        if kind is Vector2:
+            return Vector2(self.x + other.x, self.y + other.y)
+        elif kind is float or kind is int:
+            return Vector2(self.x + other, self.y + other)
         else:
             return NotImplemented
 
-    def __radd__(self, other: Vector2) -> Vector2:
-        if isinstance(other, Vector2):
-            return vector2_add(self, other)
-        elif isinstance(other, int) or isinstance(other, float):
-            return vector2_add_value(self, other)
+    def __radd__(self, other: Union[Vector2, float]) -> Vector2:
+        kind = type(other)
+        if kind is Vector2:
+            return Vector2(other.x + self.x, other.y + self.y)
+        elif kind is float or kind is int:
+            return Vector2(other + self.x, other + self.y)
         else:
             return NotImplemented
 
     def __sub__(self, value: Union[Vector2, float]) -> Vector2:
-        if isinstance(value, Vector2):
-            return vector2_subtract(self, value)
-        elif isinstance(value, float) or isinstance(value, int):
-            return vector2_subtract_value(self, value)
+        kind = type(value)
+        if kind is Vector2:
+            return Vector2(self.x - value.x, self.y - value.y)
+        elif kind is float or kind is int:
+            return Vector2(self.x - value, self.y - value)
         else:
             return NotImplemented
 
     def __rsub__(self, value: Union[Vector2, float]) -> Vector2:
-        if isinstance(value, Vector2):
-            return vector2_subtract(self, value)
-        elif isinstance(value, float) or isinstance(value, int):
-            return vector2_subtract_value(self, value)
+        kind = type(value)
+        if kind is Vector2:
+            return Vector2(value.x - self.x, value.y - self.y)
+        elif kind is float or kind is int:
+            return Vector2(value - self.x, value - self.y)
         else:
             return NotImplemented
 
+    def scale(self, s: float) -> Vector2:
+        return Vector2(self.x * s, self.y * s)
+
+    # Scaling by a number is the common case (pos * dt), so it is checked first
     def __mul__(self, value: Union[Vector2, float]) -> Vector2:
-        if isinstance(value, Vector2):
-            return vector2_multiply(self, value)
-        elif isinstance(value, float) or isinstance(value, int):
-            return vector2_scale(self, value)
+        kind = type(value)
+        if kind is float or kind is int:
+            return Vector2(self.x * value, self.y * value)
+        elif kind is Vector2:
+            return Vector2(self.x * value.x, self.y * value.y)
         else:
             return NotImplemented
 
     def __rmul__(self, value: Union[Vector2, float]) -> Vector2:
-        if isinstance(value, Vector2):
-            return vector2_multiply(self, value)
-        elif isinstance(value, float) or isinstance(value, int):
-            return vector2_scale(self, value)
+        kind = type(value)
+        if kind is float or kind is int:
+            return Vector2(value * self.x, value * self.y)
+        elif kind is Vector2:
+            return Vector2(value.x * self.x, value.y * self.y)
         else:
             return NotImplemented
 
-    def __truediv__(self, other) -> Vector2:
-        if isinstance(other, Vector2):
-            return vector2_divide(self, other)
-        elif isinstance(other, float) or isinstance(other, int):
+    def __truediv__(self, other: Union[Vector2, float]) -> Vector2:
+        kind = type(other)
+        if kind is Vector2:
+            # Python raises on zero division where raymath gives inf/nan,
+            # hand those rare cases to raymath to keep its results
+            if other.x == 0 or other.y == 0:
+                return _Vector2Divide(self, other)
+            return Vector2(self.x / other.x, self.y / other.y)
+        elif kind is float or kind is int:
             return Vector2(self.x / other, self.y / other)
         else:
             return NotImplemented
 
     def __eq__(self, other: object) -> bool:
-        if not isinstance(other, Vector2):
+        if type(other) is not Vector2:
             return NotImplemented
         return other.x == self.x and other.y == self.y
 
@@ -166,12 +186,23 @@ class Matrix:
 # Color, 4 components, R8G8B8A8 (32bit)
 class Color(ctypes.Structure):
     _fields_ = [
-        ("r", Char),    # Color red value
-        ("g", Char),    # Color green value
-        ("b", Char),    # Color blue value
-        ("a", Char)     # Color alpha value
+        ("r", UChar),   # Color red value
+        ("g", UChar),   # Color green value
+        ("b", UChar),   # Color blue value
+        ("a", UChar)    # Color alpha value
     ]
 
+    @classmethod
+    def from_u32(cls, value: int) -> Color:
+        # Same byte order as the struct in memory, red is the lowest byte
+        return cls(value & 0xFF,
+                   (value >> 8) & 0xFF,
+                   (value >> 16) & 0xFF,
+                   (value >> 24) & 0xFF)
+
+    def to_u32(self) -> int:
+        return self.r | self.g << 8 | self.b << 16 | self.a << 24
+
 
 # Colors
 # TODO: Maybe create enum for it?
@@ -227,7 +258,7 @@ class Image(ctypes.Structure):
 # Texture, tex data stored in GPU memory (VRAM)
 class Texture(ctypes.Structure):
     _fields_ = [
-        ("id", Int),        # OpenGL texture id
+        ("id", UInt),       # OpenGL texture id
         ("width", Int),     # Texture base width
         ("height", Int),    # Texture base height
         ("mipmaps", Int),   # Mipmap levels, 1 by default
@@ -246,7 +277,7 @@ TextureCubemap = Texture
 # RenderTexture, fbo for texture rendering
 class RenderTexture(ctypes.Structure):
     _fields_ = [
-        ("id", Int),            # OpenGL framebuffer object id
+        ("id", UInt),           # OpenGL framebuffer object id
         ("texture", Texture),   # Color buffer attachment texture
         ("depth", Texture)      # Depth buffer attachment texture
     ]
@@ -255,160 +286,57 @@ class RenderTexture(ctypes.Structure):
 RenderTexture2D = RenderTexture
 
 
+# Camera2D, defines position/orientation in 2d space
+class Camera2D(ctypes.Structure):
+    _fields_ = [
+        ("offset", Vector2),    # Camera offset (displacement from target)
+        ("target", Vector2),    # Camera target (rotation and zoom origin)
+        ("rotation", Float),    # Camera rotation in degrees
+        ("zoom", Float)         # Camera zoom (scaling), should be 1.0f by default
+    ]
+
+
 # ----------------------
 #   Enums declarations
 # ----------------------
 
 class TextureFilter(IntEnum):
     # No filter, just pixel approximation
-    POINT = auto(0),
+    POINT = 0
     # Linear filtering
-    BILINEAR = auto(),
+    BILINEAR = 1
     # Trilinear filtering (linear with mipmaps)
-    TRILINEAR = auto(),
+    TRILINEAR = 2
     # Anisotropic filtering 4x
-    ANISOTROPIC_4X = auto(),
+    ANISOTROPIC_4X = 3
     # Anisotropic filtering 8x
-    ANISOTROPIC_8X = auto(),
+    ANISOTROPIC_8X = 4
     # Anisotropic filtering 16x
-    ANISOTROPIC_16X = auto(),
+    ANISOTROPIC_16X = 5
 
 
 class TraceLogLevel(IntEnum):
     # Display all logs
-    ALL     = auto(0)
+    ALL     = 0
     # Trace logging, intended for internal use only
-    TRACE   = auto()
+    TRACE   = 1
     # Debug logging, used for internal debugging,
     # it should be disabled on release builds
-    DEBUG   = auto()
+    DEBUG   = 2
     # Info logging, used for program execution info
-    INFO    = auto()
+    INFO    = 3
     # Warning logging, used on recoverable failures
-    WARNING = auto()
+    WARNING = 4
     # Error logging, used on unrecoverable failures
-    ERROR   = auto()
+    ERROR   = 5
     # Fatal logging, used to abort program: exit(EXIT_FAILURE)
-    FATAL   = auto()
+    FATAL   = 6
     # Disable logging
-    NONE    = auto()
-
-
-class KeyboardKey(IntEnum):
-    NULL            = 0,        # Key: NULL, used for no key pressed
-    # Alphanumeric keys
-    APOSTROPHE      = 39,       # Key: '
-    COMMA           = 44,       # Key: ,
-    MINUS           = 45,       # Key: -
-    PERIOD          = 46,       # Key: .
-    SLASH           = 47,       # Key: /
-    ZERO            = 48,       # Key: 0
-    ONE             = 49,       # Key: 1
-    TWO             = 50,       # Key: 2
-    THREE           = 51,       # Key: 3
-    FOUR            = 52,       # Key: 4
-    FIVE            = 53,       # Key: 5
-    SIX             = 54,       # Key: 6
-    SEVEN           = 55,       # Key: 7
-    EIGHT           = 56,       # Key: 8
-    NINE            = 57,       # Key: 9
-    SEMICOLON       = 59,       # Key: ;
-    EQUAL           = 61,       # Key: =
-    A               = 65,       # Key: A | a
-    B               = 66,       # Key: B | b
-    C               = 67,       # Key: C | c
-    D               = 68,       # Key: D | d
-    E               = 69,       # Key: E | e
-    F               = 70,       # Key: F | f
-    G               = 71,       # Key: G | g
-    H               = 72,       # Key: H | h
-    I               = 73,       # Key: I | i
-    J               = 74,       # Key: J | j
-    K               = 75,       # Key: K | k
-    L               = 76,       # Key: L | l
-    M               = 77,       # Key: M | m
-    N               = 78,       # Key: N | n
-    O               = 79,       # Key: O | o
-    P               = 80,       # Key: P | p
-    Q               = 81,       # Key: Q | q
-    R               = 82,       # Key: R | r
-    S               = 83,       # Key: S | s
-    T               = 84,       # Key: T | t
-    U               = 85,       # Key: U | u
-    V               = 86,       # Key: V | v
-    W               = 87,       # Key: W | w
-    X               = 88,       # Key: X | x
-    Y               = 89,       # Key: Y | y
-    Z               = 90,       # Key: Z | z
-    LEFT_BRACKET    = 91,       # Key: [
-    BACKSLASH       = 92,       # Key: '\'
-    RIGHT_BRACKET   = 93,       # Key: ]
-    GRAVE           = 96,       # Key: `
-    # Function keys
-    SPACE           = 32,       # Key: Space
-    ESCAPE          = 256,      # Key: Esc
-    ENTER           = 257,      # Key: Enter
-    TAB             = 258,      # Key: Tab
-    BACKSPACE       = 259,      # Key: Backspace
-    INSERT          = 260,      # Key: Ins
-    DELETE          = 261,      # Key: Del
-    RIGHT           = 262,      # Key: Cursor right
-    LEFT            = 263,      # Key: Cursor left
-    DOWN            = 264,      # Key: Cursor down
-    UP              = 265,      # Key: Cursor up
-    PAGE_UP         = 266,      # Key: Page up
-    PAGE_DOWN       = 267,      # Key: Page down
-    HOME            = 268,      # Key: Home
-    END             = 269,      # Key: End
-    CAPS_LOCK       = 280,      # Key: Caps lock
-    SCROLL_LOCK     = 281,      # Key: Scroll down
-    NUM_LOCK        = 282,      # Key: Num lock
-    PRINT_SCREEN    = 283,      # Key: Print screen
-    PAUSE           = 284,      # Key: Pause
-    F1              = 290,      # Key: F1
-    F2              = 291,      # Key: F2
-    F3              = 292,      # Key: F3
-    F4              = 293,      # Key: F4
-    F5              = 294,      # Key: F5
-    F6              = 295,      # Key: F6
-    F7              = 296,      # Key: F7
-    F8              = 297,      # Key: F8
-    F9              = 298,      # Key: F9
-    F10             = 299,      # Key: F10
-    F11             = 300,      # Key: F11
-    F12             = 301,      # Key: F12
-    LEFT_SHIFT      = 340,      # Key: Shift left
-    LEFT_CONTROL    = 341,      # Key: Control left
-    LEFT_ALT        = 342,      # Key: Alt left
-    LEFT_SUPER      = 343,      # Key: Super left
-    RIGHT_SHIFT     = 344,      # Key: Shift right
-    RIGHT_CONTROL   = 345,      # Key: Control right
-    RIGHT_ALT       = 346,      # Key: Alt right
-    RIGHT_SUPER     = 347,      # Key: Super right
-    KB_MENU         = 348,      # Key: KB menu
-    # Keypad keys
-    KP_0            = 320,      # Key: Keypad 0
-    KP_1            = 321,      # Key: Keypad 1
-    KP_2            = 322,      # Key: Keypad 2
-    KP_3            = 323,      # Key: Keypad 3
-    KP_4            = 324,      # Key: Keypad 4
-    KP_5            = 325,      # Key: Keypad 5
-    KP_6            = 326,      # Key: Keypad 6
-    KP_7            = 327,      # Key: Keypad 7
-    KP_8            = 328,      # Key: Keypad 8
-    KP_9            = 329,      # Key: Keypad 9
-    KP_DECIMAL      = 330,      # Key: Keypad .
-    KP_DIVIDE       = 331,      # Key: Keypad /
-    KP_MULTIPLY     = 332,      # Key: Keypad *
-    KP_SUBTRACT     = 333,      # Key: Keypad -
-    KP_ADD          = 334,      # Key: Keypad +
-    KP_ENTER        = 335,      # Key: Keypad Enter
-    KP_EQUAL        = 336,      # Key: Keypad =
-    # Android key buttons
-    BACK            = 4,        # Key: Android back button
-    MENU            = 82,       # Key: Android menu button
-    VOLUME_UP       = 24,       # Key: Android volume up button
-    VOLUME_DOWN     = 25        # Key: Android volume down button
+    NONE    = 7
+
+
+# KeyboardKey lives in .keys and is only loaded on first access, see
+# __getattr__ below
 
 
 # ------------------------
@@ -416,207 +344,337 @@ class KeyboardKey(IntEnum):
 # ------------------------
 
 
-def _wrapper(func, result_type, *args_types):
-    func.argtypes = args_types
-    func.restype = result_type
-    return func
-
-
-# raylib.h functions bindings
-
-_DrawFPS = _wrapper(raylib.DrawFPS, None, Int, Int)
-_ColorFromHSV = _wrapper(raylib.ColorFromHSV, Color, Float, Float, Float)
-_SetTargetFPS = _wrapper(raylib.SetTargetFPS, None, Int)
-_InitWindow = _wrapper(raylib.InitWindow, None, Int, Int, CharPtr)
-_CloseWindow = _wrapper(raylib.CloseWindow, None)
-_WindowShouldClose = _wrapper(raylib.WindowShouldClose, Bool)
-_BeginDrawing = _wrapper(raylib.BeginDrawing, None)
-_EndDrawing = _wrapper(raylib.EndDrawing, None)
-_GetScreenWidth = _wrapper(raylib.GetScreenWidth, Int)
-_GetScreenHeight = _wrapper(raylib.GetScreenHeight, Int)
-_ClearBackground = _wrapper(raylib.ClearBackground, None, Color)
-_DrawRectangle = _wrapper(raylib.DrawRectangle, None, Int, Int, Int, Int, Color)
-_DrawRectangleV = _wrapper(raylib.DrawRectangleV, None, Vector2, Vector2, Color)
-_DrawLineEx = _wrapper(raylib.DrawLineEx, None, Vector2, Vector2, Float, Color)
-_GetFrameTime = _wrapper(raylib.GetFrameTime, Float)
-_IsKeyPressed = _wrapper(raylib.IsKeyPressed, Bool, Int)
-_SetTraceLogLevel = _wrapper(raylib.SetTraceLogLevel, None, Int)
-_LoadRenderTexture = _wrapper(raylib.LoadRenderTexture, RenderTexture, Int, Int)
-_BeginTextureMode = _wrapper(raylib.BeginTextureMode, None, RenderTexture2D)
-_EndTextureMode = _wrapper(raylib.EndTextureMode, None)
-# Draw text (using default font)
-# RLAPI void DrawText(const char *text, int posX, int posY, int fontSize, Color color);
-_DrawText = _wrapper(raylib.DrawText, None, CharPtr, Int, Int, Int, Color)
-# Measure string width for default font
-# RLAPI int MeasureText(const char *text, int fontSize);
-_MeasureText = _wrapper(raylib.MeasureText, Int, CharPtr, Int)
-# Draw a Texture2D
-_DrawTexture = _wrapper(raylib.DrawTexture, None, Texture2D, Int, Int, Color)
-# Draw a Texture2D with extended parameters
-_DrawTextureEx = _wrapper(raylib.DrawTextureEx, None, Texture2D, Vector2, Float, Float, Color)
-# Set texture scaling filter mode
-_SetTextureFilter = _wrapper(raylib.SetTextureFilter, None, Texture2D, Int)
-# Draw a part of a texture defined by a rectangle with 'pro' parameters
-_DrawTexturePro = _wrapper(raylib.DrawTexturePro, None, Texture2D, Rectangle, Rectangle, Vector2, Float, Color)
-# RLAPI void DrawCircleV(Vector2 center, float radius, Color color)
-# Draw a color-filled circle (Vector version)
-_DrawCircleV = _wrapper(raylib.DrawCircleV, None, Vector2, Float, Color)
-# RLAPI Color ColorAlpha(Color color, float alpha)
-# Get color with alpha applied, alpha goes from 0.0f to 1.0f
-_ColorAlpha = _wrapper(raylib.ColorAlpha, Color, Color, Float)
-
+def _bind(name, result_type, *args_types):
+    # Build a typed prototype and instantiate it for the library symbol,
+    # instead of patching argtypes/restype on the shared raylib attribute
+    prototype = ctypes.CFUNCTYPE(result_type, *args_types)
+    return prototype((name, raylib))
+
+
+# Every bound function as (name, result type, argument types). Each one is
+# bound below to a module level "_<name>" callable.
+
+_FUNCTIONS = (
+    # raylib.h
+    ("DrawFPS", None, (Int, Int)),
+    ("ColorFromHSV", Color, (Float, Float, Float)),
+    ("SetTargetFPS", None, (Int,)),
+    ("InitWindow", None, (Int, Int, CharPtr)),
+    ("CloseWindow", None, ()),
+    ("WindowShouldClose", Bool, ()),
+    ("BeginDrawing", None, ()),
+    ("EndDrawing", None, ()),
+    ("GetScreenWidth", Int, ()),
+    ("GetScreenHeight", Int, ()),
+    ("ClearBackground", None, (Color,)),
+    ("DrawRectangle", None, (Int, Int, Int, Int, Color)),
+    ("DrawRectangleV", None, (Vector2, Vector2, Color)),
+    ("DrawLineEx", None, (Vector2, Vector2, Float, Color)),
+    ("GetFrameTime", Float, ()),
+    ("IsKeyPressed", Bool, (Int,)),
+    ("SetTraceLogLevel", None, (Int,)),
+    ("LoadRenderTexture", RenderTexture, (Int, Int)),
+    ("BeginTextureMode", None, (RenderTexture2D,)),
+    ("EndTextureMode", None, ()),
+    ("BeginMode2D", None, (Camera2D,)),
+    ("EndMode2D", None, ()),
+    # Draw text (using default font)
+    # RLAPI void DrawText(const char *text, int posX, int posY, int fontSize, Color color);
+    ("DrawText", None, (CharPtr, Int, Int, Int, Color)),
+    # Measure string width for default font
+    # RLAPI int MeasureText(const char *text, int fontSize);
+    ("MeasureText", Int, (CharPtr, Int)),
+    # Draw a Texture2D
+    ("DrawTexture", None, (Texture2D, Int, Int, Color)),
+    # Draw a part of a texture defined by a rectangle
+    ("DrawTextureRec", None, (Texture2D, Rectangle, Vector2, Color)),
+    # Draw a Texture2D with extended parameters
+    ("DrawTextureEx", None, (Texture2D, Vector2, Float, Float, Color)),
+    # Set texture scaling filter mode
+    ("SetTextureFilter", None, (Texture2D, Int)),
+    # Draw a part of a texture defined by a rectangle with 'pro' parameters
+    ("DrawTexturePro", None, (Texture2D, Rectangle, Rectangle, Vector2, Float, Color)),
+    # Generate image: checked
+    ("GenImageChecked", Image, (Int, Int, Int, Int, Color, Color)),
+    # Unload image from CPU memory (RAM)
+    ("UnloadImage", None, (Image,)),
+    # Load texture from image data
+    ("LoadTextureFromImage", Texture2D, (Image,)),
+    # Unload texture from GPU memory (VRAM)
+    ("UnloadTexture", None, (Texture2D,)),
+    # RLAPI void DrawCircleV(Vector2 center, float radius, Color color)
+    # Draw a color-filled circle (Vector version)
+    ("DrawCircleV", None, (Vector2, Float, Color)),
+    # RLAPI Color ColorAlpha(Color color, float alpha)
+    # Get color with alpha applied, alpha goes from 0.0f to 1.0f
+    ("ColorAlpha", Color, (Color, Float)),
+    # raymath.h
+    ("Vector2Add", Vector2, (Vector2, Vector2)),
+    ("Vector2AddValue", Vector2, (Vector2, Float)),
+    ("Vector2Divide", Vector2, (Vector2, Vector2)),
+    ("Vector2Lerp", Vector2, (Vector2, Vector2, Float)),
+    ("Vector2Multiply", Vector2, (Vector2, Vector2)),
+    ("Vector2Scale", Vector2, (Vector2, Float)),
+    ("Vector2Subtract", Vector2, (Vector2, Vector2)),
+    ("Vector2SubtractValue", Vector2, (Vector2, Float)),
+    ("Lerp", Float, (Float, Float, Float)),
+)
+
+for _name, _result_type, _args_types in _FUNCTIONS:
+    globals()['_' + _name] = _bind(_name, _result_type, *_args_types)
+del _name, _result_type, _args_types
+
+
+# raylib.h functions wrappers
 
 def draw_fps(x: int, y: int) -> None:
     _DrawFPS(int(x), int(y))
 
 
-def color_from_hsv(hue: float, saturation: float, value: float) -> Color:
-    return _ColorFromHSV(float(hue), float(saturation), float(value))
+# color_from_hsv(hue: float, saturation: float, value: float) -> Color
+color_from_hsv = _ColorFromHSV
 
 
 def load_render_texture(width: int, height: int) -> RenderTexture:
     return _LoadRenderTexture(int(width), int(height))
 
 
-def set_trace_log_level(level: int) -> None:
-    _SetTraceLogLevel(level)
+def gen_image_checked(width: int, height: int, checks_x: int, checks_y: int, col1: Color, col2: Color) -> Image:
+    return _GenImageChecked(int(width), int(height), int(checks_x), int(checks_y), col1, col2)
+
+
+# unload_image(image: Image) -> None
+unload_image = _UnloadImage
+
+
+# load_texture_from_image(image: Image) -> Texture2D
+load_texture_from_image = _LoadTextureFromImage
+
+
+# unload_texture(texture: Texture2D) -> None
+unload_texture = _UnloadTexture
+
+
+# set_trace_log_level(level: int) -> None
+set_trace_log_level = _SetTraceLogLevel
 
 
 def set_texture_filter(texture: Texture, filter_: int) -> None:
     _SetTextureFilter(texture, int(filter_))
 
 
-def init_window(width: int, height: int, title: str) -> None:
-    _InitWindow(int(width), int(height), title.encode('UTF-8'))
+# Text is usually the same few labels drawn every frame, so encoded strings
+# are cached. Already encoded bytes are also accepted and passed as is.
+@functools.lru_cache(maxsize=256)
+def _encode(text: str) -> bytes:
+    return text.encode('UTF-8')
+
+
+def init_window(width: int, height: int, title: Union[str, bytes]) -> None:
+    if isinstance(title, str):
+        title = _encode(title)
+    _InitWindow(int(width), int(height), title)
 
 
-def close_window() -> None:
-    _CloseWindow()
+# close_window() -> None
+close_window = _CloseWindow
 
 
 def draw_rectangle(x: int, y: int, width: int, height: int, color: Color) -> None:
     _DrawRectangle(int(x), int(y), int(width), int(height), color)
 
 
-def draw_line_ex(start_pos: Vector2, end_pos: Vector2, thick: float, color: Color):
-    _DrawLineEx(start_pos, end_pos, float(thick), color)
+def draw_rectangles(xs: Sequence[int], ys: Sequence[int], widths: Sequence[int], heights: Sequence[int], color: Color) -> None:
+    # Rectangle n is (xs[n], ys[n], widths[n], heights[n]). One call draws
+    # them all with the bound function kept in a local, so the per-rectangle
+    # cost is just the ctypes call itself.
+    draw = _DrawRectangle
+    for x, y, width, height in zip(xs, ys, widths, heights):
+        draw(int(x), int(y), int(width), int(height), color)
 
 
-def draw_text(text: str, x: int, y: int, font_size: int, color: Color) -> None:
-    _DrawText(text.encode('UTF-8'), int(x), int(y), int(font_size), color)
+# draw_line_ex(start_pos: Vector2, end_pos: Vector2, thick: float, color: Color)
+draw_line_ex = _DrawLineEx
 
 
-def measure_text(text: str, font_size: int) -> int:
-    return _MeasureText(text.encode('UTF-8'), int(font_size))
+def draw_text(text: Union[str, bytes], x: int, y: int, font_size: int, color: Color) -> None:
+    if isinstance(text, str):
+        text = _encode(text)
+    _DrawText(text, int(x), int(y), int(font_size), color)
+
+
+def measure_text(text: Union[str, bytes], font_size: int) -> int:
+    if isinstance(text, str):
+        text = _encode(text)
+    return _MeasureText(text, int(font_size))
 
 
 def draw_texture(texture: Texture2D, x: int, y: int, tint: Color) -> None:
     _DrawTexture(texture, int(x), int(y), tint)
 
 
-def draw_texture_ex(texture: Texture2D, position: Vector2, rotation: float, scale: float, tint: Color):
-    _DrawTextureEx(texture, position, float(rotation), float(scale), tint)
+# draw_texture_rec(texture: Texture2D, source: Rectangle, position: Vector2, tint: Color) -> None
+draw_texture_rec = _DrawTextureRec
+
 
+# draw_texture_ex(texture: Texture2D, position: Vector2, rotation: float, scale: float, tint: Color)
+draw_texture_ex = _DrawTextureEx
 
-def draw_texture_pro(texture: Texture2D, source: Rectangle, dest: Rectangle, origin: Vector2, rotation: float, tint: Color):
-    _DrawTexturePro(texture, source, dest, origin, float(rotation), tint)
 
+# draw_texture_pro(texture: Texture2D, source: Rectangle, dest: Rectangle, origin: Vector2, rotation: float, tint: Color)
+draw_texture_pro = _DrawTexturePro
 
-def draw_rectangle_v(position: Vector2, size: Vector2, color: Color) -> None:
-    _DrawRectangleV(position, size, color)
 
+# draw_rectangle_v(position: Vector2, size: Vector2, color: Color) -> None
+draw_rectangle_v = _DrawRectangleV
 
-def draw_circle_v(position: Vector2, radius: float, color: Color) -> None:
-    _DrawCircleV(position, float(radius), color)
+
+# draw_circle_v(position: Vector2, radius: float, color: Color) -> None
+draw_circle_v = _DrawCircleV
 
 
 def set_target_fps(fps: int) -> None:
     _SetTargetFPS(int(fps))
 
 
-def window_should_close() -> bool:
-    return _WindowShouldClose()
+# window_should_close() -> bool
+window_should_close = _WindowShouldClose
+
 
+# begin_drawing() -> None
+begin_drawing = _BeginDrawing
 
-def begin_drawing() -> None:
-    _BeginDrawing()
 
+# begin_texture_mode(texture: RenderTexture2D) -> None
+begin_texture_mode = _BeginTextureMode
 
-def begin_texture_mode(texture: RenderTexture2D) -> None:
-    _BeginTextureMode(texture)
 
+# end_texture_mode() -> None
+end_texture_mode = _EndTextureMode
 
-def end_texture_mode() -> None:
-    _EndTextureMode()
 
+# begin_mode_2d(camera: Camera2D) -> None
+begin_mode_2d = _BeginMode2D
 
-def get_screen_width() -> int:
-    return _GetScreenWidth()
 
+# end_mode_2d() -> None
+end_mode_2d = _EndMode2D
 
-def get_screen_height() -> int:
-    return _GetScreenHeight()
 
+# get_screen_width() -> int
+get_screen_width = _GetScreenWidth
 
-def clear_background(color: Color) -> None:
-    _ClearBackground(color)
 
+# get_screen_height() -> int
+get_screen_height = _GetScreenHeight
 
-def get_frame_time() -> float:
-    return _GetFrameTime()
 
+# clear_background(color: Color) -> None
+clear_background = _ClearBackground
 
-def end_drawing() -> None:
-    _EndDrawing()
 
+# get_frame_time() -> float
+get_frame_time = _GetFrameTime
 
-def is_key_pressed(key: int) -> None:
-    return _IsKeyPressed(int(key))
+
+# end_drawing() -> None
+end_drawing = _EndDrawing
+
+
+# is_key_pressed(key: int) -> bool
+is_key_pressed = _IsKeyPressed
 
 
 def color_alpha(color: Color, alpha: float) -> Color:
-    return _ColorAlpha(color, float(alpha))
+    # Same as raylib's ColorAlpha, without a ctypes round trip
+    alpha = min(max(alpha, 0.0), 1.0)
+    return Color(color.r, color.g, color.b, int(255 * alpha))
+
+
+# raymath.h functions wrappers
+
+# lerp(start: float, end: float, amount: float) -> float
+lerp = _Lerp
+
+
+# vector2_multiply(vec1: Vector2, vec2: Vector2) -> Vector2
+vector2_multiply = _Vector2Multiply
+
+
+# vector2_add(vec1: Vector2, vec2: Vector2) -> Vector2
+vector2_add = _Vector2Add
+
+
+# vector2_add_value(vec: Vector2, value: float) -> Vector2
+vector2_add_value = _Vector2AddValue
+
+
+# vector2_divide(vec1: Vector2, vec2: Vector2) -> Vector2
+vector2_divide = _Vector2Divide
+
 
+# vector2_lerp(vec1: Vector2, vec2: Vector2, amount: float) -> Vector2
+vector2_lerp = _Vector2Lerp
 
-# raymath.h functions bindings
 
-_Vector2Add = _wrapper(raylib.Vector2Add, Vector2, Vector2, Vector2)
-_Vector2Divide = _wrapper(raylib.Vector2Divide, Vector2, Vector2, Vector2)
-_Vector2Lerp = _wrapper(raylib.Vector2Lerp, Vector2, Vector2, Vector2, Float)
-_Vector2Multiply = _wrapper(raylib.Vector2Multiply, Vector2, Vector2, Vector2)
-_Vector2Scale = _wrapper(raylib.Vector2Scale, Vector2, Vector2, Float)
-_Vector2Subtract = _wrapper(raylib.Vector2Subtract, Vector2, Vector2, Vector2)
-_Vector2SubtractValue = _wrapper(raylib.Vector2SubtractValue, Vector2, Vector2, Float)
-_Lerp = _wrapper(raylib.Lerp, Float, Float, Float, Float)
+# vector2_scale(vec: Vector2, scale: float) -> Vector2
+vector2_scale = _Vector2Scale
 
 
-def lerp(start: float, end: float, amount: float) -> float:
-    return _Lerp(float(start), float(end), float(amount))
+# vector2_subtract(vec1: Vector2, vec2: Vector2) -> Vector2
+vector2_subtract = _Vector2Subtract
 
 
-def vector2_multiply(vec1: Vector2, vec2: Vector2) -> Vector2:
-    return _Vector2Multiply(vec1, vec2)
+# vector2_subtract_value(vec: Vector2, value: float) -> Vector2
+vector2_subtract_value = _Vector2SubtractValue
 
 
-def vector2_add(vec1: Vector2, vec2: Vector2) -> Vector2:
-    return _Vector2Add(vec1, vec2)
+# Batched versions of the raymath functions above, for arrays of vectors
+# such as particle positions. They take any sequences of Vector2 (lists or
+# ctypes Vector2 arrays) and return a new ctypes Vector2 array. The math is
+# done in Python, one raymath call per element would mostly be spent in
+# ctypes overhead.
 
+def vector2_add_batch(vecs1: Sequence[Vector2], vecs2: Sequence[Vector2]) -> ctypes.Array:
+    if len(vecs1) != len(vecs2):
+        raise ValueError('Vector sequences must have the same length')
+    return (Vector2 * len(vecs1))(*[
+        (vec1.x + vec2.x, vec1.y + vec2.y) for vec1, vec2 in zip(vecs1, vecs2)
+    ])
 
-def vector2_divide(vec1: Vector2, vec2: Vector2) -> Vector2:
-    return _Vector2Divide(vec1, vec2)
 
+def vector2_scale_batch(vecs: Sequence[Vector2], scale: float) -> ctypes.Array:
+    return (Vector2 * len(vecs))(*[(vec.x * scale, vec.y * scale) for vec in vecs])
 
-def vector2_lerp(vec1: Vector2, vec2: Vector2, amount: float) -> Vector2:
-    return _Vector2Lerp(vec1, vec2, float(amount))
 
+# View a contiguous float32 buffer of x, y pairs (e.g. array('f')) as a ctypes
+# Vector2 array without copying. The view shares memory with the buffer, so
+# the buffer must not be resized while the view is alive.
+def as_vector2_array(buffer: Any) -> ctypes.Array:
+    view = memoryview(buffer)
+    if view.format != 'f' or not view.c_contiguous:
+        raise ValueError('Buffer must be a contiguous float32 buffer')
+    if view.nbytes % ctypes.sizeof(Vector2) != 0:
+        raise ValueError('Buffer must hold whole x, y pairs')
+    return (Vector2 * (view.nbytes // ctypes.sizeof(Vector2))).from_buffer(buffer)
 
-def vector2_scale(vec: Vector2, scale: float) -> Vector2:
-    return _Vector2Scale(vec, scale)
 
+# Per-frame input polling. The bound raylib functions are stored on the
+# instance, so input.pressed(key) is a slot lookup followed straight by the
+# ctypes call, with no Python wrapper frame in between. Keys are plain ints
+# (see KeyboardKey).
+class Input:
+    __slots__ = ('pressed', 'frame_time')
 
-def vector2_subtract(vec1: Vector2, vec2: Vector2) -> Vector2:
-    return _Vector2Subtract(vec1, vec2)
+    def __init__(self) -> None:
+        self.pressed = _IsKeyPressed
+        self.frame_time = _GetFrameTime
 
 
-def vector2_subtract_value(vec: Vector2, value: float) -> Vector2:
-    return _Vector2SubtractValue(vec, value)
+# Lazy access to the keyboard constants (PEP 562)
+def __getattr__(name: str) -> Any:
+    if name == 'KeyboardKey':
+        from .keys import KeyboardKey
+        globals()['KeyboardKey'] = KeyboardKey
+        return KeyboardKey
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')